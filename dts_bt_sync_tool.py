@@ -40,19 +40,80 @@ if not USE_WINSOUND:
     except Exception:
         SIMPLEAUDIO_AVAILABLE = False
 
+# Longest tone we will synthesize; keeps typed-in lengths from allocating huge buffers
+MAX_TONE_MS = 2000
+
+# One period of sine, indexed with a fixed-point phase accumulator when synthesizing tones
+_SINE_TABLE_SIZE = 4096
+_SINE_TABLE_BITS = _SINE_TABLE_SIZE.bit_length() - 1
+assert _SINE_TABLE_SIZE == 1 << _SINE_TABLE_BITS, "sine table size must be a power of two"
+_SINE_TABLE = None
+# Scratch buffers reused across syntheses (grown on demand, guarded by _TONE_CACHE_LOCK)
+_SCRATCH_IDX = _SCRATCH_PHASE = _SCRATCH_TABLE_IDX = _SCRATCH_F32 = _SCRATCH_I16 = None
+if SIMPLEAUDIO_AVAILABLE:
+    _SINE_TABLE = np.linspace(0, 2 * np.pi, _SINE_TABLE_SIZE, endpoint=False, dtype=np.float32)
+    np.sin(_SINE_TABLE, out=_SINE_TABLE)
+
+# Ready-to-play tones (simpleaudio WaveObjects) keyed by (freq, n_samples, volume); beeps repeat a lot
+_TONE_CACHE = {}
+_TONE_CACHE_LOCK = threading.Lock()
+
+
+def _ensure_scratch(n):
+    """Make sure the scratch buffers hold at least n samples."""
+    global _SCRATCH_IDX, _SCRATCH_PHASE, _SCRATCH_TABLE_IDX, _SCRATCH_F32, _SCRATCH_I16
+    if _SCRATCH_F32 is None or len(_SCRATCH_F32) < n:
+        size = max(n, 44100)
+        _SCRATCH_IDX = np.arange(size, dtype=np.uint32)
+        _SCRATCH_PHASE = np.empty(size, dtype=np.uint32)
+        # np.take wants native intp indices; anything else is converted to a fresh copy
+        _SCRATCH_TABLE_IDX = np.empty(size, dtype=np.intp)
+        _SCRATCH_F32 = np.empty(size, dtype=np.float32)
+        _SCRATCH_I16 = np.empty(size, dtype=np.int16)
+
+
+def _tone_wave(freq, n, volume, sample_rate=44100):
+    """Return a cached simpleaudio WaveObject holding n samples of the given tone."""
+    key = (int(freq), int(n), round(float(volume), 3))
+    with _TONE_CACHE_LOCK:
+        wave = _TONE_CACHE.get(key)
+        if wave is None:
+            n = key[1]
+            _ensure_scratch(n)
+            phase = _SCRATCH_PHASE[:n]
+            table_idx = _SCRATCH_TABLE_IDX[:n]
+            tone = _SCRATCH_F32[:n]
+            # 32-bit phase step; uint32 wraparound is the phase modulo one period,
+            # and the top _SINE_TABLE_BITS bits select the table entry
+            step = np.uint32(round(key[0] * (1 << 32) / sample_rate) & 0xFFFFFFFF)
+            np.multiply(_SCRATCH_IDX[:n], step, out=phase)
+            np.right_shift(phase, np.uint32(32 - _SINE_TABLE_BITS), out=table_idx)
+            # Indices are already in range; mode="raise" would buffer `out` internally
+            np.take(_SINE_TABLE, table_idx, out=tone, mode="wrap")
+            np.multiply(tone, np.float32(key[2] * 32767), out=tone)
+            np.rint(tone, out=_SCRATCH_I16[:n], casting="unsafe")
+            # Copy out of the scratch buffer so it can be reused for the next tone
+            wave = sa.WaveObject(_SCRATCH_I16[:n].tobytes(), 1, 2, sample_rate)
+            _TONE_CACHE[key] = wave
+    return wave
+
 
 def play_beep(freq=1000, duration_ms=150, volume=0.2):
     """Play a short beep without blocking the UI."""
+    if duration_ms <= 0 or freq <= 0:
+        return False
+    duration_ms = min(duration_ms, MAX_TONE_MS)
     if USE_WINSOUND:
         threading.Thread(target=lambda: winsound.Beep(int(freq), int(duration_ms)), daemon=True).start()
         return True
     elif SIMPLEAUDIO_AVAILABLE:
         sample_rate = 44100
-        t = np.linspace(0, duration_ms/1000.0, int(sample_rate * (duration_ms/1000.0)), False)
-        tone = float(volume) * np.sin(freq * 2 * np.pi * t)
-        audio = (tone * 32767).astype(np.int16)
+        n = int(sample_rate * (duration_ms/1000.0))
+        if n < 1:
+            # Shorter than one sample; nothing to synthesize
+            return False
         try:
-            sa.play_buffer(audio, 1, 2, sample_rate)
+            _tone_wave(freq, n, volume, sample_rate).play()
             return True
         except Exception:
             return False
@@ -91,6 +152,11 @@ class SyncApp:
         self.countdown_step_ms_var = tk.IntVar(value=700)  # time per number
         self.countdown_beeps_var = tk.BooleanVar(value=True)
 
+        # Label refreshes are coalesced to one per event-loop turn while dragging
+        self._label_pending = False
+        # Last rendered info block; identical text skips the canvas relayout
+        self._last_info_text = None
+
         # --- Top controls ---
         top = ttk.Frame(root, padding=10)
         top.pack(fill=tk.X)
@@ -179,11 +245,21 @@ class SyncApp:
                 "Then run this app again."
             )
 
-        self._repeat_timer = None
+        self._repeat_after_id = None
+        self._next_deadline = None
         self._running_repeat = False
 
-        # Handle resizing for center text
-        root.bind("<Configure>", lambda e: self._center_text())
+        # Handle resizing for center text (coalesced to one re-center per burst)
+        self._resize_pending = None
+        root.bind("<Configure>", self._on_configure)
+
+    def _on_configure(self, _event=None):
+        if self._resize_pending is None:
+            self._resize_pending = self.root.after_idle(self._do_center)
+
+    def _do_center(self):
+        self._resize_pending = None
+        self._center_text()
 
     def _center_text(self):
         w = self.flash.winfo_width()
@@ -193,20 +269,30 @@ class SyncApp:
         except Exception:
             pass
 
-    def frames_to_ms(self, frames):
-        fps = max(self.fps_var.get(), 1e-6)
+    def frames_to_ms(self, frames, fps=None):
+        if fps is None:
+            fps = self.fps_var.get()
+        fps = max(fps, 1e-6)
         return 1000.0 * (frames / fps)
 
     def _update_labels(self, *_):
+        if not self._label_pending:
+            self._label_pending = True
+            self.root.after_idle(self._do_update_labels)
+
+    def _do_update_labels(self):
+        self._label_pending = False
+        fps = self.fps_var.get()
         frames = self.audio_delay_frames_var.get()
-        ms = self.frames_to_ms(frames)
+        ms = self.frames_to_ms(frames, fps)
         lead_lag = "Audio delayed" if self.delay_target_var.get() == "Audio" else "Visual delayed"
         sign_text = " (target leads)" if frames < 0 else (" (target lags)" if frames > 0 else "")
         self.delay_label.config(text=f"{frames:+.2f} frames → {ms:+.0f} ms  [{lead_lag}{sign_text}]")
-        self._update_info_text()
+        self._update_info_text(fps)
 
-    def _update_info_text(self):
-        fps = self.fps_var.get()
+    def _update_info_text(self, fps=None):
+        if fps is None:
+            fps = self.fps_var.get()
         base = self.base_frames_var.get()
         rounded = self.rounded_frames_var.get()
         adjust = self.audio_delay_frames_var.get()
@@ -219,18 +305,22 @@ class SyncApp:
             suggested = base + adjust
             direction = "base + delay"
 
-        latency_ms = self.frames_to_ms(abs(adjust))
+        latency_ms = self.frames_to_ms(abs(adjust), fps)
 
         lines = [
             f"FPS: {fps:.3f}",
             f"Physical head→gate: {base:.2f} frames (rounded: {rounded})",
-            f"Delay target: {target}   |   Set delay: {adjust:+.2f} frames ≈ {self.frames_to_ms(adjust):+.0f} ms",
+            f"Delay target: {target}   |   Set delay: {adjust:+.2f} frames ≈ {self.frames_to_ms(adjust, fps):+.0f} ms",
             f"Suggest DTS setting ≈ {direction} = {suggested:.2f} frames",
             f"(Guide: |adjust| ≈ {latency_ms:.0f} ms at {fps:.3f} fps)",
             "",
             "Hotkeys: ←/→ = ±0.25 frame, ↑/↓ = ±1 frame, Space = Test"
         ]
-        self.flash.itemconfig(self.text_id, text="\n".join(lines))
+        text = "\n".join(lines)
+        if text == self._last_info_text:
+            return
+        self._last_info_text = text
+        self.flash.itemconfig(self.text_id, text=text)
 
     def nudge_delay(self, delta_frames):
         self.audio_delay_frames_var.set(self.audio_delay_frames_var.get() + delta_frames)
@@ -249,11 +339,10 @@ class SyncApp:
         if freq is None:
             freq = max(50, int(self.tone_freq_var.get()))
         if dur is None:
-            dur = max(20, int(self.tone_ms_var.get()))
+            dur = min(MAX_TONE_MS, max(20, int(self.tone_ms_var.get())))
         ok = play_beep(freq=freq, duration_ms=dur, volume=vol)
         if not ok:
             try:
-                from tkinter import messagebox
                 messagebox.showwarning("Audio backend not found",
                                         "Couldn't play audio.\n\nOn macOS/Linux, install:\n\n    pip install simpleaudio numpy")
             except Exception:
@@ -269,7 +358,7 @@ class SyncApp:
             if frames >= 0:
                 # Flash first, then delay beep
                 self._flash_on()
-                threading.Timer(delay_ms/1000.0, self._do_beep).start() if delay_ms > 0 else self._do_beep()
+                self.root.after(delay_ms, self._do_beep) if delay_ms > 0 else self._do_beep()
             else:
                 # Beep first, then delay flash
                 self._do_beep()
@@ -282,7 +371,7 @@ class SyncApp:
             else:
                 # Flash first, then delay beep
                 self._flash_on()
-                threading.Timer(delay_ms/1000.0, self._do_beep).start() if delay_ms > 0 else self._do_beep()
+                self.root.after(delay_ms, self._do_beep) if delay_ms > 0 else self._do_beep()
 
     def _run_with_countdown(self):
         """Show 3-2-1 countdown, optional soft beeps, then perform the test."""
@@ -316,21 +405,29 @@ class SyncApp:
             self._schedule_next_repeat()
         else:
             self._running_repeat = False
-            if hasattr(self, "_repeat_timer") and self._repeat_timer:
-                self._repeat_timer.cancel()
-                self._repeat_timer = None
+            if getattr(self, "_repeat_after_id", None):
+                self.root.after_cancel(self._repeat_after_id)
+                self._repeat_after_id = None
+            self._next_deadline = None
             self.next_label.config(text="")
 
     def _schedule_next_repeat(self):
         if not getattr(self, "_running_repeat", False):
             return
         interval = max(200, int(self.repeat_interval_ms_var.get()))
+        now = time.monotonic()
+        # Advance a monotonic deadline so late ticks don't push the cadence back;
+        # resync if we fell more than a whole interval behind (e.g. after a stall).
+        deadline = self._next_deadline
+        if deadline is None or now - deadline > interval/1000.0:
+            deadline = now
+        self._next_deadline = deadline + interval/1000.0
+        delay = max(1, int(round((self._next_deadline - now) * 1000)))
         self.next_label.config(text=f"Next in {interval} ms")
-        self._repeat_timer = threading.Timer(interval/1000.0, self._repeat_tick)
-        self._repeat_timer.daemon = True
-        self._repeat_timer.start()
+        self._repeat_after_id = self.root.after(delay, self._repeat_tick)
 
     def _repeat_tick(self):
+        self._repeat_after_id = None
         if not getattr(self, "_running_repeat", False):
             return
         try: